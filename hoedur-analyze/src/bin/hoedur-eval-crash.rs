@@ -1,4 +1,8 @@
-use std::{fmt, io, path::PathBuf};
+use std::{
+    fmt,
+    io::{self, Write},
+    path::PathBuf,
+};
 
 use anyhow::{Context, Result};
 use clap::Parser;
@@ -7,7 +11,7 @@ use common::{
     log::{init_log, LOG_INFO},
     FxHashMap,
 };
-use hoedur::coverage::CoverageReport;
+use hoedur::coverage::{CoverageReport, CrashReason};
 use modeling::input::InputId;
 use serde::Serialize;
 
@@ -20,6 +24,14 @@ struct Arguments {
     #[arg(long)]
     yaml: bool,
 
+    /// JSON output (one line per result)
+    #[arg(long, conflicts_with = "yaml")]
+    json: bool,
+
+    /// Evaluate every report on its own (one result per report, in order)
+    #[arg(long)]
+    batch: bool,
+
     reports: Vec<PathBuf>,
 }
 
@@ -59,11 +71,23 @@ fn main() -> Result<()> {
     init_log(&opt.log_config)?;
     log::trace!("Args: {:#?}", opt);
 
+    if opt.batch {
+        for path in &opt.reports {
+            print_crashes(crash_times(std::slice::from_ref(path)), &opt)?;
+        }
+
+        Ok(())
+    } else {
+        print_crashes(crash_times(&opt.reports), &opt)
+    }
+}
+
+fn crash_times(reports: &[PathBuf]) -> Vec<(CrashReason, CrashTime)> {
     let mut crashes = FxHashMap::default();
 
-    for path in opt.reports {
+    for path in reports {
         log::info!("Loading coverage report {:?} ...", path);
-        let report = match CoverageReport::load_from(&path) {
+        let report = match CoverageReport::load_from(path) {
             Ok(report) => report,
             Err(err) => {
                 log::error!("Failed to load coverage report {:?}: {:?}", path, err);
@@ -118,9 +142,21 @@ fn main() -> Result<()> {
     let mut crashes: Vec<_> = crashes.into_iter().collect();
     crashes.sort_by(|a, b| a.1.time.cmp(&b.1.time));
 
+    crashes
+}
+
+fn print_crashes(crashes: Vec<(CrashReason, CrashTime)>, opt: &Arguments) -> Result<()> {
     // print crashes with time
     if opt.yaml {
-        serde_yaml::to_writer(io::stdout(), &crashes).context("Failed to serialize crashes")
+        // one YAML document per call (separated for multi-document streams)
+        let mut stdout = io::stdout().lock();
+        serde_yaml::to_writer(&mut stdout, &crashes).context("Failed to serialize crashes")?;
+        writeln!(stdout).context("Failed to write crashes")
+    } else if opt.json {
+        // one JSON line per call
+        let mut stdout = io::stdout().lock();
+        serde_json::to_writer(&mut stdout, &crashes).context("Failed to serialize crashes")?;
+        writeln!(stdout).context("Failed to write crashes")
     } else {
         for (crash, crash_time) in crashes {
             println!("{} : {:x?} :\t {}", crash_time, crash, crash_time.source);
@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
-import threading
 
 from fuzz_common import *
 
@@ -27,48 +25,40 @@ def main():
     # build
     build('hoedur-eval-crash')
 
-    threads = []
     workloads = []
 
+    # collect reports
+    target_reports = collect_reports(args.corpus, args.targets)
+
     for target in args.targets:
         bug_combination_outdir = os.path.join(args.output, target)
         os.makedirs(bug_combination_outdir, exist_ok=True)
 
-        # collect reports
-        reports = glob.glob(
-            '{}/TARGET-{}-*.report.bin.zst'.format(args.corpus, target.replace('/', '-')))
-        reports.sort()
+        reports = [os.path.join(args.corpus, report)
+                   for report in target_reports[target]]
 
         for i, report in enumerate(reports):
             outfile = os.path.join(
                 bug_combination_outdir, BUG_COMBINATION_YAML_NAME_FORMAT.format(i+1))
             workloads.append((report, outfile))
 
-    max = len(workloads)
-
-    # start threads
-    for _ in range(args.cores):
-        t = threading.Thread(target=crash_time, args=(workloads, max))
-        t.start()
-        threads.append(t)
+    # run process per core
+    run_parallel(crash_time(workloads), args.cores)
 
-    for t in threads:
-        t.join()
 
+def crash_time(workloads):
+    max = len(workloads)
 
-def crash_time(workloads, max):
-    while len(workloads) > 0:
+    for i, (report, outpath) in enumerate(workloads):
         # next target
-        report, outpath = workloads.pop(0)
-        eprint('run', max - len(workloads), '/', max, ':', report)
-
-        with open(outpath, "w") as f:
-            # collect crash timings in report group
-            subprocess.run(
-                binary('hoedur-eval-crash') + ['--yaml', report], stdout=f)
-
-        eprint('done', report)
-
+        eprint('run', i + 1, '/', max, ':', report)
+
+        # child writes to the output file directly (no buffered file object)
+        yield (
+            binary('hoedur-eval-crash') + ['--yaml', report],
+            {'stdout_file': outpath},
+            lambda _, report=report: eprint('done', report)
+        )
 
 if __name__ == '__main__':
     main()
@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
 from pathlib import Path
-import threading
 
 from fuzz_common import *
 
@@ -25,44 +23,33 @@ def main():
 
     # runs
     runs = []
-    for target in args.targets:
-        target_filename = target.replace('/', '-')
-        for report in corpus.glob(f'TARGET-{target_filename}-*.report.bin.zst'):
-            runs.append((target, report))
-    max = len(runs)
-
-    # start thread per core of host
-    threads = []
-    for num in range(cpu_cores()):
-        t = threading.Thread(target=run_executions,
-                             args=(output, corpus, runs, max))
-        t.start()
-        threads.append(t)
+    for (target, reports) in collect_reports(corpus, args.targets).items():
+        for report in reports:
+            basename = report.replace('.report.bin.zst', '')
+            run_name = basename[basename.find('FUZZER'):]
+            corpus_tar = corpus / f'{basename}.corpus.tar.zst'
+            reproducers_dir = output / target / run_name
 
-    # join threads
-    for t in threads:
-        t.join()
+            runs.append((corpus / report, corpus_tar, reproducers_dir))
 
+    # run process per core of host
+    run_parallel(run_executions(corpus, runs), cpu_cores())
 
-def run_executions(output, corpus, runs, max):
-    while len(runs) > 0:
-        (target, report) = runs.pop(0)
 
-        eprint('run', max - len(runs), '/', max, ':', corpus)
+def run_executions(corpus, runs):
+    max = len(runs)
 
-        basename = report.name.replace('.report.bin.zst', '')
-        run_name = basename[basename.find('FUZZER'):]
-        corpus_tar = f'{basename}.corpus.tar.zst'
-        reproducers_dir = output / target / f'{run_name}'
+    for i, (report, corpus_tar, reproducers_dir) in enumerate(runs):
+        eprint('run', i + 1, '/', max, ':', corpus)
 
         os.makedirs(reproducers_dir, exist_ok=True)
 
-        run(binary('hoedur-reproducer') + [
+        yield (binary('hoedur-reproducer') + [
             reproducers_dir,
             '--corpus-archive',
-            corpus / corpus_tar,
+            corpus_tar,
             '--report',
-            report])
+            report], {}, None)
 
 
 if __name__ == '__main__':
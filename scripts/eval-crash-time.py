@@ -1,11 +1,8 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
-import json
+import multiprocessing
 import os
-import threading
-import yaml
 
 from fuzz_common import *
 
@@ -20,43 +17,45 @@ def main():
     parser.add_argument('--cores', type=int, default=cpu_cores(logical=True))
     args = parser.parse_args()
 
-    # build
-    build('hoedur-eval-crash')
+    # build (rebuild binaries without batch / JSON output)
+    build('hoedur-eval-crash', flags=['--batch', '--json'])
 
-    threads = []
-    timings = {}
-    targets = list(args.targets)
+    # collect reports
+    target_reports = collect_reports(args.corpus, args.targets)
     max = len(args.targets)
-
-    # start threads
-    for _ in range(args.cores):
-        t = threading.Thread(target=crash_time, args=(
-            args.corpus, args.include_non_crashing_inputs, args.exclude_unknown_crashes, timings, targets, max))
-        t.start()
-        threads.append(t)
-
-    for t in threads:
-        t.join()
+    jobs = [(
+        i + 1,
+        max,
+        target,
+        [os.path.join(args.corpus, report)
+         for report in target_reports[target]],
+        args.include_non_crashing_inputs,
+        args.exclude_unknown_crashes
+    ) for i, target in enumerate(args.targets)]
+
+    # collect + parse crash timings in worker process per core (keep target order)
+    timings = {target: [] for target in args.targets}
+    with multiprocessing.Pool(args.cores) as pool:
+        for (target, target_timing) in pool.imap_unordered(crash_time, jobs):
+            timings[target] = target_timing
+            eprint('done', target)
 
     # DEBUG: eprint(timings)
 
     # collect timings
     experiment_timings = {}
     for (target, target_timing) in timings.items():
-        # collect target bugs
-        bugs = []
+        # collect target bugs (dedup)
+        bugs = set()
         for report_timings in target_timing:
-            bugs += list(report_timings.keys())
-
-        # dedup + sort bugs
-        bugs = sorted(list(set(bugs)))
+            bugs.update(report_timings)
 
         # create target
         if not target in experiment_timings:
             experiment_timings[target] = {}
 
-        # collect bug timings
-        for bug in bugs:
+        # collect bug timings (sorted)
+        for bug in sorted(bugs):
             # create bug
             experiment_timings[target][bug] = []
 
@@ -89,73 +88,73 @@ def main():
 
     # write output json
     if args.output_json:
-        open(args.output_json, 'w').write(
-            json.dumps(experiment_timings, indent=4)
-        )
+        json_dump(experiment_timings, args.output_json)
+
+
+def crash_time(job):
+    (num, max, target, reports, include_non_crashing_inputs, exclude_unknown_crashes) = job
 
+    # next target
+    eprint('run', num, '/', max, ':', target)
+    if len(reports) == 0:
+        return (target, [])
 
-def crash_time(corpus, include_non_crashing_inputs, exclude_unknown_crashes, timings, targets, max):
     # include non-crashing inputs (for bug hooks) in timings
     args = []
     if include_non_crashing_inputs:
         args = ['--include-non-crashing-inputs']
 
-    while len(targets) > 0:
-        # next target
-        target = targets.pop(0)
-        eprint('run', max - len(targets), '/', max, ':', target)
-
-        # collect reports
-        reports = glob.glob(
-            '{}/TARGET-{}-*.report.bin.zst'.format(corpus, target.replace('/', '-')))
-        reports.sort()
-
-        target_timing = []
-        for report in reports:
-            # collect crash timings in report group
-            result = subprocess.run(
-                binary('hoedur-eval-crash') + ['--yaml'] + args + [report], capture_output=True)
-
-            # parse crash timings
-            crash_timings = yaml.safe_load(result.stdout)
-            # DEBUG: eprint(crash_timings)
-
-            # select first / matching bug
-            report_timing = {}
-            for [reason, crash_time] in crash_timings:
-                # crash eval data
-                time = crash_time['time']
-                source = crash_time['source']
-
-                # bug / crash reason
-                if 'Bug' in reason:
-                    bug = reason['Bug']
-                elif not exclude_unknown_crashes:
-                    if 'Crash' in reason:
-                        crash = reason['Crash']
-                        bug = 'crash_pc-{:08x}_ra-{:08x}'.format(
-                            crash['pc'], crash['ra'])
-                    elif 'NonExecutable' in reason:
-                        non_exec = reason['NonExecutable']
-                        bug = 'non-exec_pc-{:08x}'.format(non_exec['pc'])
-                    elif 'RomWrite' in reason:
-                        rom_write = reason['RomWrite']
-                        bug = 'rom-write_pc-{:08x}_addr-{:08x}'.format(
-                            rom_write['pc'], rom_write['addr'])
-                    else:
-                        assert (False)
-                else:
-                    continue
-
-                report_timing[bug] = {'time': time, 'source': source}
-
-            # collect report timings
-            target_timing.append(report_timing)
-
-        # collect target timings
-        timings[target] = target_timing
-
-        eprint('done', target)
+    # collect crash timings of all reports (one JSON line per report)
+    cmd = binary('hoedur-eval-crash') + ['--json', '--batch'] + args + reports
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as p:
+        # parse crash timings as they are written (in report order)
+        target_timing = [report_timing(json_loads(line), exclude_unknown_crashes)
+                         for line in p.stdout]
+
+    if p.returncode != 0:
+        raise subprocess.CalledProcessError(p.returncode, cmd)
+
+    # timings are matched to reports by position: fail on missing lines
+    if len(target_timing) != len(reports):
+        raise RuntimeError(
+            f'got {len(target_timing)} / {len(reports)} crash timings for {target}')
+
+    return (target, target_timing)
+
+
+def report_timing(crash_timings, exclude_unknown_crashes):
+    # DEBUG: eprint(crash_timings)
+
+    # select first / matching bug
+    timing = {}
+    for [reason, crash_time] in crash_timings:
+        # crash eval data
+        time = crash_time['time']
+        source = crash_time['source']
+
+        # bug / crash reason
+        if 'Bug' in reason:
+            bug = reason['Bug']
+        elif not exclude_unknown_crashes:
+            if 'Crash' in reason:
+                crash = reason['Crash']
+                bug = 'crash_pc-{:08x}_ra-{:08x}'.format(
+                    crash['pc'], crash['ra'])
+            elif 'NonExecutable' in reason:
+                non_exec = reason['NonExecutable']
+                bug = 'non-exec_pc-{:08x}'.format(non_exec['pc'])
+            elif 'RomWrite' in reason:
+                rom_write = reason['RomWrite']
+                bug = 'rom-write_pc-{:08x}_addr-{:08x}'.format(
+                    rom_write['pc'], rom_write['addr'])
+            else:
+                assert (False)
+        else:
+            continue
+
+        timing[bug] = {'time': time, 'source': source}
+
+    return timing
 
 
 if __name__ == '__main__':
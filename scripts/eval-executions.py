@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
+import functools
+import numpy as np
 import os
 from pathlib import Path
-import threading
 
 from fuzz_common import *
 
@@ -26,72 +26,58 @@ def main():
 
     # runs
     runs = []
-    for target in args.targets:
-        target_filename = target.replace('/', '-')
-        for report in corpus.glob(f'TARGET-{target_filename}-*.report.bin.zst'):
-            runs.append((corpus, report))
+    for (target, reports) in collect_reports(corpus, args.targets).items():
+        for report in reports:
+            run_name = report.replace('.report.bin.zst', '')
+            corpus_tar = corpus / f'{run_name}.corpus.tar.zst'
+            plot_data = output / f'{run_name}.txt'
+
+            runs.append((target, corpus, corpus_tar, plot_data))
+
+    # total duration + executions per target (collected as runs finish)
+    totals = {target: [0, 0] for target in args.targets}
+
+    # run process per core of host
+    run_parallel(run_executions(runs, totals), cpu_cores())
+
+    # write execution summary
+    with open(args.summary, 'w') as summary:
+        for (target, (total_duration, total_executions)) in totals.items():
+            # calculate total execs/s
+            if total_duration > 0:
+                execs = round(total_executions / total_duration, 2)
+            else:
+                execs = 0
+
+            summary.write(f'{target}\t{execs}\n')
+
+
+def add_executions(total, plot_data, returncode):
+    # failed run: plot data may be left over from an earlier invocation
+    if returncode != 0 or not plot_data.is_file():
+        return
+
+    # fuzz_duration total_executions execs/s
+    try:
+        data = np.loadtxt(plot_data, comments='#', delimiter='\t',
+                          usecols=(0, 1), dtype=np.int64, ndmin=2)
+    except ValueError as e:
+        eprint(f'WARN skipping malformed plot data {plot_data}: {e}')
+        return
+
+    total[0] += int(data[:, 0].sum())
+    total[1] += int(data[:, 1].sum())
+
+
+def run_executions(runs, totals):
     max = len(runs)
 
-    # start thread per core of host
-    threads = []
-    for num in range(cpu_cores()):
-        t = threading.Thread(target=run_executions, args=(output, runs, max))
-        t.start()
-        threads.append(t)
-
-    # join threads
-    for t in threads:
-        t.join()
-
-    # collect execution summary
-    summary = open(args.summary, 'w')
-    for target in args.targets:
-        # collect executions files
-        target_filename = target.replace('/', '-')
-        executions = glob.glob(f'{output}/TARGET-{target_filename}-*.txt')
-        executions.sort()
-
-        # total executions + duration
-        total_executions = 0
-        total_duration = 0
-        for path in executions:
-            for line in open(path, 'r').readlines():
-                # strip line
-                line = line.lstrip().rstrip()
-
-                # skip comment
-                if line.startswith('#'):
-                    continue
-
-                # fuzz_duration total_executions execs/s
-                data = line.split('\t')
-                if len(data) == 3:
-                    total_duration += int(data[0])
-                    total_executions += int(data[1])
-
-        # calculate total execs/s
-        if total_duration > 0:
-            execs = round(total_executions / total_duration, 2)
-        else:
-            execs = 0
-
-        summary.write(f'{target}\t{execs}\n')
-    summary.close()
-
-
-def run_executions(output, runs, max):
-    while len(runs) > 0:
-        (corpus, report) = runs.pop(0)
-
-        eprint('run', max - len(runs), '/', max, ':', corpus)
-
-        run_name = report.name.replace('.report.bin.zst', '')
-        corpus_tar = report.name.replace('.report.bin.zst', '.corpus.tar.zst')
-        plot_data = output / f'{run_name}.txt'
-
-        run(binary('hoedur-eval-executions') + [
+    for i, (target, corpus, corpus_tar, plot_data) in enumerate(runs):
+        eprint('run', i + 1, '/', max, ':', corpus)
+
+        yield (binary('hoedur-eval-executions') + [
             plot_data,
-            corpus / corpus_tar])
+            corpus_tar], {}, functools.partial(add_executions, totals[target], plot_data))
 
 
 if __name__ == '__main__':
@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
-import threading
 
 from fuzz_common import *
 
@@ -23,31 +21,22 @@ def main():
     # build
     build('hoedur-merge-report')
 
-    threads = []
-    targets = list(args.targets)
-    max = len(args.targets)
+    # run process per core
+    run_parallel(merge_report(args.corpus, args.group,
+                 args.output_dir, args.targets), args.cores)
 
-    # start threads
-    for _ in range(args.cores):
-        t = threading.Thread(target=merge_report, args=(
-            args.corpus, args.group, args.output_dir, targets, max))
-        t.start()
-        threads.append(t)
 
-    for t in threads:
-        t.join()
+def merge_report(corpus, group_size, output_dir, targets):
+    max = len(targets)
+    target_reports = collect_reports(corpus, targets)
 
-
-def merge_report(corpus, group_size, output_dir, targets, max):
-    while len(targets) > 0:
+    for i, target in enumerate(targets):
         # next
-        target = targets.pop(0)
-        eprint('run', max - len(targets), '/', max, ':', target)
+        eprint('run', i + 1, '/', max, ':', target)
 
         # collect reports
-        reports = glob.glob(
-            '{}/TARGET-{}-*.report.bin.zst'.format(corpus, target.replace('/', '-')))
-        reports.sort()
+        reports = [os.path.join(corpus, report)
+                   for report in target_reports[target]]
 
         # verify count
         remainder = len(reports) % group_size
@@ -56,20 +45,18 @@ def merge_report(corpus, group_size, output_dir, targets, max):
 
         # group reports
         group_count = len(reports) // group_size
-        for i in range(group_count):
-            name = 'TARGET-{}-RUN-{:02d}'.format(target.replace('/', '-'), i+1)
+        for group in range(group_count):
+            name = 'TARGET-{}-RUN-{:02d}'.format(target.replace('/', '-'), group+1)
             output = '{}/{}.report.bin.zst'.format(output_dir, name)
-            report_group = reports[(i * group_size): ((i+1) * group_size)]
+            report_group = reports[(group * group_size): ((group+1) * group_size)]
 
             # merge reports
-            subprocess.run(binary('hoedur-merge-report') + [
+            yield (binary('hoedur-merge-report') + [
                 '--name',
                 name,
                 '--output',
                 output
-            ] + report_group)
-
-        eprint('done', target)
+            ] + report_group, {}, None)
 
 
 if __name__ == '__main__':
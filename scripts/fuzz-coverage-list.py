@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
-import threading
 from pathlib import Path
 
 from fuzz_common import *
@@ -42,34 +40,39 @@ def main():
 
     # collect reports
     runs = []
-    for target in args.targets:
+    for (target, reports) in collect_reports(corpus, args.targets).items():
         target_filename = target.replace('/', '-')
-        for report in glob.glob('{}/TARGET-{}-*.report.bin.zst'.format(corpus, target_filename)):
-            runs.append((corpus, report, target, target_filename))
-    max = len(runs)
+        for report in reports:
+            basename = report.replace('.report.bin.zst', '')
+            runs.append((corpus, corpus / report, target,
+                        target_filename, basename))
 
     # build
     build('hoedur-coverage-list')
 
-    # start thread per core of host
-    threads = []
-    for num in range(cpu_cores()):
-        t = threading.Thread(target=run_coverage_list, args=(
-            runs, args.no_basic_block_filter, output, config_name, bug_filter, max))
-        t.start()
-        threads.append(t)
+    # output dirs
+    output_details = output / 'details'
+    output_superset = output / 'summary'
+
+    # append config_name if set
+    if config_name:
+        output_details /= config_name
+        output_superset /= config_name
 
-    for t in threads:
-        t.join()
+    # mkdir
+    os.makedirs(output_details, exist_ok=True)
+    os.makedirs(output_superset, exist_ok=True)
 
+    # run process per core of host
+    run_parallel(run_coverage_list(
+        runs, args.no_basic_block_filter, output_details, output_superset, bug_filter), cpu_cores())
 
-def run_coverage_list(runs, no_basic_block_filter, output, config_name, bug_filter, max):
-    while len(runs) > 0:
-        (corpus, report, target, target_filename) = runs.pop(0)
 
-        eprint('run', max - len(runs), '/', max, ':', corpus, target_filename)
+def run_coverage_list(runs, no_basic_block_filter, output_details, output_superset, bug_filter):
+    max = len(runs)
 
-        basename = os.path.basename(report).replace('.report.bin.zst', '')
+    for i, (corpus, report, target, target_filename, basename) in enumerate(runs):
+        eprint('run', i + 1, '/', max, ':', corpus, target_filename)
 
         # optional basic block filter
         if no_basic_block_filter:
@@ -80,25 +83,12 @@ def run_coverage_list(runs, no_basic_block_filter, output, config_name, bug_filt
                 f'{HOEDUR_TARGETS}/arm/{target}/valid_basic_blocks.txt',
             ]
 
-        # output dirs
-        output_details = output / 'details'
-        output_superset = output / 'summary'
-
-        # append config_name if set
-        if config_name:
-            output_details /= config_name
-            output_superset /= config_name
-
-        # mkdir
-        os.makedirs(output_details, exist_ok=True)
-        os.makedirs(output_superset, exist_ok=True)
-
-        run(binary('hoedur-coverage-list') + [
+        yield (binary('hoedur-coverage-list') + [
             '--output-superset', output_superset / f'{basename}.txt',
             '--output', output_details / f'{basename}.coverage.tar.zst',
         ] + bb_filter + bug_filter + [
             report
-        ])
+        ], {}, None)
 
 
 if __name__ == '__main__':
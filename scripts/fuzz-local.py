@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 
 import argparse
-import subprocess
-import threading
-import time
+import asyncio
+import traceback
 
 from fuzz_common import *
-from fuzz import do_fuzzer_run
+from fuzz import do_hoedur_run_async
 
 
 def main():
@@ -34,42 +33,41 @@ def main():
                         runs, args.fuzzers, args.modes, args.duration, args.trace, args.log)
 
 
-def local_runner(core, cores, fuzz_runs, max):
-    eprint(core, 'start')
+async def local_runner(slots, num, max, config, corpus, hoedur, trace, log):
+    (corpus_base, target, fuzzer, _, _, duration, run, _) = config
 
-    while len(fuzz_runs) > 0:
-        # wait for exisiting fuzzing runs
-        pids = []
-        try:
-            output = subprocess.check_output(['pgrep', 'hoedur']).splitlines()
-        except Exception as e:
-            output = []
-        for line in output:
-            if len(line) > 0:
-                pids.append(int(line))
+    # wait for a free core
+    async with slots:
+        # do next fuzzing run
+        print('run', num, '/', max, ':', config)
+        await do_hoedur_run_async(corpus, hoedur, corpus_base, target,
+                                  fuzzer, True, duration, run, trace, log)
+        eprint('done', config)
 
-        if len(pids) >= cores:
-            eprint(core, 'wait')
-            time.sleep(30)
-            continue
 
-        # recheck to decrease race condition
-        if len(fuzz_runs) < 1:
-            break
+async def local_runners(cores, fuzz_runs, trace, log):
+    slots = asyncio.Semaphore(cores)
+    max = len(fuzz_runs)
 
-        # do next fuzzing run
-        fuzz_args = fuzz_runs.pop(0)
-        print(core, 'run', max - len(fuzz_runs), '/', max, ':', fuzz_args)
-        try:
-            do_fuzzer_run(*fuzz_args)
-        except CorpusExistsException as e:
-            eprint(e)
-        eprint(core, 'done', fuzz_args)
+    # a failing run must not cancel (and stop) the other runs
+    results = await asyncio.gather(*[local_runner(slots, num + 1, max, config, corpus, hoedur, trace, log)
+                                     for (num, (config, corpus, hoedur)) in enumerate(fuzz_runs)],
+                                   return_exceptions=True)
 
+    # report errors
+    failed = 0
+    for ((config, _, _), result) in zip(fuzz_runs, results):
+        if isinstance(result, BaseException):
+            eprint('ERROR: run failed:', config)
+            traceback.print_exception(
+                type(result), result, result.__traceback__)
+            failed += 1
+
+    if failed > 0:
+        raise RuntimeError(f'{failed} / {max} fuzzer runs failed')
 
-def do_local_fuzzer_run(cores, name, targets, runs, fuzzers, modes, duration, trace, log):
-    fuzz_runs = []
 
+def do_local_fuzzer_run(cores, name, targets, runs, fuzzers, modes, duration, trace, log):
     # collect mode arguments
     mode_args = []
     for mode in modes:
@@ -93,43 +91,31 @@ def do_local_fuzzer_run(cores, name, targets, runs, fuzzers, modes, duration, tr
 
         mode_args.append(tuple(args))
 
-    # collect list of fuzz runs
+    # collect list of fuzz runs (init_hoedur args)
+    configs = []
     for fuzzer in fuzzers:
         for target in targets:
             for (models, fuzzware) in mode_args:
                 for run in runs:
-                    fuzz_args = (
+                    configs.append((
                         'corpus/{}-{}/'.format(name, fuzzer),
                         target,
                         fuzzer,
                         models,
                         fuzzware,
-                        True,
                         duration,
                         run,
-                        False,
-                        trace,
-                        log
-                    )
-
-                    fuzz_runs.append(
-                        fuzz_args
-                    )
-    max = len(fuzz_runs)
-
-    # start thread per core
-    threads = []
-
-    for core in range(cores):
-        t = threading.Thread(target=local_runner,
-                             args=(core, cores, fuzz_runs, max))
-        t.start()
-        threads.append(t)
+                        False
+                    ))
 
-        time.sleep(1)
+    # init all runs (dirs are created once), skip existing corpora
+    (fuzz_runs, errors) = init_hoedur_batch(configs)
+    for (_, e) in errors:
+        eprint(e)
 
-    for t in threads:
-        t.join()
+    # fuzzing run per core, all runs are awaited on one event loop
+    # (python <= 3.11 still uses a child watcher thread per process)
+    asyncio.run(local_runners(cores, fuzz_runs, trace, log))
 
 
 if __name__ == '__main__':
@@ -1,23 +1,12 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
 import os
 from pathlib import Path
-import threading
 
 from fuzz_common import *
 
 
-def merge_dict(dst, src):
-    for key in src.keys():
-        if isinstance(src[key], dict) and (key in dst and isinstance(dst[key], dict)):
-            # recursive merge
-            merge_dict(dst[key], src[key])
-        else:
-            dst[key] = src[key]
-
-
 def main():
     parser = argparse.ArgumentParser(description='create plot data')
     parser.add_argument('output', help='output path (dir)')
@@ -42,7 +31,7 @@ def main():
     # read plot overview
     plot = {'data': {}, 'plots': {}}
     if os.path.isfile(args.plot):
-        old = json.loads(open(args.plot).read())
+        old = json_load(args.plot)
 
         if 'data' in old:
             plot['data'] = old['data']
@@ -60,45 +49,45 @@ def main():
     output = Path(args.output)
     root = args.root and Path(args.root)
 
+    plot_data_dir = output / config_name
+    os.makedirs(plot_data_dir, exist_ok=True)
+
     # runs
     runs = []
-    for target in args.targets:
+    for (target, reports) in collect_reports(corpus, args.targets).items():
         target_filename = target.replace('/', '-')
-        for report in corpus.glob(f'TARGET-{target_filename}-*.report.bin.zst'):
-            runs.append((corpus, report, target, target_filename))
-    max = len(runs)
-
-    # start thread per core of host
-    threads = []
-    for num in range(cpu_cores()):
-        t = threading.Thread(target=run_plot_data, args=(
-            config_name, output, root, args.no_basic_block_filter, args.only_coverage, bug_filter, plot, runs, max))
-        t.start()
-        threads.append(t)
-
-    for t in threads:
-        t.join()
-
-    # write plot overview
-    plot['data'] = json.loads(json.dumps(plot['data'], sort_keys=True))
-    open(args.plot, 'w').write(json.dumps(plot, indent=4))
+        for report in reports:
+            run_name = report.replace('.report.bin.zst', '')
+            run_name_base = run_name.replace(f'{target_filename}-', '')
+            run_num = '-'.join(run_name_base.split('-')[1:])
+            corpus_tar = corpus / f'{run_name}.corpus.tar.zst'
+            plot_data = plot_data_dir / f'{run_name}.json.zst'
+
+            runs.append((corpus, corpus / report, target, target_filename,
+                        run_num, corpus_tar, plot_data))
+
+    # run process per core of host
+    run_parallel(run_plot_data(
+        args.no_basic_block_filter, args.only_coverage, bug_filter, runs), cpu_cores())
+
+    # add runs to plot overview
+    for (_, _, target, _, run_num, _, plot_data) in runs:
+        # replace root (relative path)
+        if root:
+            plot_data = plot_data.relative_to(root)
 
+        plot['data'].setdefault(config_name, {}).setdefault(
+            target, {})[run_num] = str(plot_data)
 
-def run_plot_data(config_name, output, root, no_basic_block_filter, only_coverage, bug_filter, plot, runs, max):
-    while len(runs) > 0:
-        (corpus, report, target, target_filename) = runs.pop(0)
+    # write plot overview (sorted data)
+    json_dump(plot, args.plot, sort_keys=True)
 
-        eprint('run', max - len(runs), '/', max, ':', corpus, target_filename)
 
-        run_name = report.name.replace('.report.bin.zst', '')
-        run_name_base = run_name.replace(f'{target_filename}-', '')
-        run_num = '-'.join(run_name_base.split('-')[1:])
-        corpus_tar = report.name.replace('.report.bin.zst', '.corpus.tar.zst')
-        plot_data_dir = output / config_name
-        plot_data = plot_data_dir / f'{run_name}.json.zst'
+def run_plot_data(no_basic_block_filter, only_coverage, bug_filter, runs):
+    max = len(runs)
 
-        # mkdir
-        os.makedirs(plot_data_dir, exist_ok=True)
+    for i, (corpus, report, target, target_filename, run_num, corpus_tar, plot_data) in enumerate(runs):
+        eprint('run', i + 1, '/', max, ':', corpus, target_filename)
 
         # optional basic block filter
         if no_basic_block_filter:
@@ -113,27 +102,16 @@ def run_plot_data(config_name, output, root, no_basic_block_filter, only_coverag
         if only_coverage:
             archive = []
         else:
-            archive = ['--corpus-archive', corpus / corpus_tar]
+            archive = ['--corpus-archive', corpus_tar]
 
         # export data to JSON
-        run(binary('hoedur-plot-data') +
-            bb_filter +
-            bug_filter + [
-            plot_data,
-            '--report',
-            report
-        ] + archive)
-
-        # replace root (relative path)
-        if root:
-            plot_data = plot_data.relative_to(root)
-
-        # add to plot overview
-        if not config_name in plot['data']:
-            plot['data'][config_name] = {}
-        if not target in plot['data'][config_name]:
-            plot['data'][config_name][target] = {}
-        plot['data'][config_name][target][run_num] = str(plot_data)
+        yield (binary('hoedur-plot-data') +
+               bb_filter +
+               bug_filter + [
+                   plot_data,
+                   '--report',
+                   report
+               ] + archive, {}, None)
 
 
 if __name__ == '__main__':
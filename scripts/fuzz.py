@@ -2,6 +2,7 @@
 
 import subprocess
 import argparse
+import asyncio
 import glob
 import os
 
@@ -28,9 +29,21 @@ def main():
 
 
 def do_fuzzer_run(corpus_base, target, fuzzer, models, fuzzware, statistics, duration, run_id, overwrite, trace, log):
-    corpus, hoedur = init_hoedur(
-        corpus_base, target, fuzzer, models, fuzzware, duration, run_id, overwrite)
+    asyncio.run(do_fuzzer_run_async(corpus_base, target, fuzzer, models, fuzzware,
+                                    statistics, duration, run_id, overwrite, trace, log))
 
+
+async def do_fuzzer_run_async(corpus_base, target, fuzzer, models, fuzzware, statistics, duration, run_id, overwrite, trace, log):
+    # init may build / copy files: keep it off the event loop
+    loop = asyncio.get_running_loop()
+    corpus, hoedur = await loop.run_in_executor(None, init_hoedur,
+                                                corpus_base, target, fuzzer, models, fuzzware, duration, run_id, overwrite)
+
+    await do_hoedur_run_async(corpus, hoedur, corpus_base, target,
+                              fuzzer, statistics, duration, run_id, trace, log)
+
+
+async def do_hoedur_run_async(corpus, hoedur, corpus_base, target, fuzzer, statistics, duration, run_id, trace, log):
     # run fuzzer
     print(f'running fuzzer {fuzzer} for {duration} with run id {run_id} ...')
 
@@ -40,7 +53,9 @@ def do_fuzzer_run(corpus_base, target, fuzzer, models, fuzzware, statistics, dur
         cmd += ['--statistics']
 
     try:
-        run(cmd, log, f'{corpus}.log', timeout=parse_duration(duration))
+        # long grace period: fuzzer finalizes the corpus archive on exit
+        await run_async(cmd, log, f'{corpus}.log', timeout=parse_duration(duration),
+                        grace_seconds=10 * 60)
     except subprocess.TimeoutExpired:
         pass
 
@@ -48,12 +63,13 @@ def do_fuzzer_run(corpus_base, target, fuzzer, models, fuzzware, statistics, dur
 
     # collect coverage
     archive = corpus + '.corpus.tar.zst'
-    do_run_cov(archive, fuzzer, target, corpus, trace, log)
+    await do_run_cov(archive, fuzzer, target, corpus, trace, log)
 
 
-def do_run_cov(archive, fuzzer, target, corpus, trace, log):
+async def do_run_cov(archive, fuzzer, target, corpus, trace, log):
     # use archive
-    hoedur = init_hoedur_import_config(fuzzer, archive)
+    loop = asyncio.get_running_loop()
+    hoedur = await loop.run_in_executor(None, init_hoedur_import_config, fuzzer, archive)
 
     # enable debug / trace
     cmd = hoedur + [
@@ -64,7 +80,7 @@ def do_run_cov(archive, fuzzer, target, corpus, trace, log):
         cmd += ['--trace-file', corpus + '.trace.bin.zst']
 
     # add hooks
-    for hook in glob.iglob('{}/{}/{}/hook*.rn'.format(HOEDUR_TARGETS, HOEDUR_ARCH, target)):
+    for hook in glob.iglob(f'{TARGET_BASE}/{target}/hook*.rn'):
         cmd += ['--hook', hook]
 
     # run-cov
@@ -75,7 +91,7 @@ def do_run_cov(archive, fuzzer, target, corpus, trace, log):
     ]
 
     print('collecting coverage ...')
-    run(cmd, log, f'{corpus}.cov.log')
+    await run_async(cmd, log, f'{corpus}.cov.log')
 
 
 if __name__ == '__main__':
@@ -1,20 +1,56 @@
 #!/usr/bin/env python3
 
+import asyncio
+import bisect
+import fcntl
+import functools
+import json
 import os
+import re
+import select
 import shutil
-import psutil
+import signal
+import stat
 import subprocess
 import sys
-import threading
+
+# optional: faster JSON (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def env(var, default=None):
-    return os.environ.get(var) or default
+    return os.environ.get(var, default)
+
+
+def env_nonempty(var, default=None):
+    # empty string counts as unset
+    val = os.environ.get(var)
+    return val if val else default
+
+
+ENV_FLAGS = {
+    '1': True, 'true': True, 'yes': True, 'on': True,
+    '0': False, 'false': False, 'no': False, 'off': False, '': False,
+}
+
+
+def env_flag(var, default=False):
+    val = os.environ.get(var)
+    if val is None:
+        return default
+
+    try:
+        return ENV_FLAGS[val.strip().lower()]
+    except KeyError:
+        raise ValueError(f'unknown boolean value for {var}: {val!r}') from None
 
 
 SCRIPTS_DIR = os.path.dirname(os.path.realpath(__file__))
-CARGO_BIN = env('HOME', '/home/user') + '/.cargo/bin'
-CODE = env('CODE', env('HOME'))
+CARGO_BIN = env_nonempty('HOME', '/home/user') + '/.cargo/bin'
+CODE = env_nonempty('CODE', env_nonempty('HOME'))
 HOEDUR_BIN = env('HOEDUR_BIN', 'hoedur')
 HOEDUR_ARCH = env('HOEDUR_ARCH', 'arm')
 HOEDUR_TARGETS = env('HOEDUR_TARGETS', CODE + '/hoedur-targets')
@@ -22,6 +58,7 @@ HOEDUR_FUZZER_CONFIG = env('HOEDUR_FUZZER_CONFIG',
                            CODE + '/hoedur-fuzzer-config')
 CONFIG_FILE = env('CONFIG_FILE', 'config.yml')
 MODELS_FILE = env('MODELS_FILE', 'models.yml.zst')
+BUILD_PROBE = env_flag('HOEDUR_BUILD_PROBE')
 
 FUZZER = {
     'hoedur': f'{HOEDUR_BIN}-{HOEDUR_ARCH}',
@@ -29,17 +66,30 @@ FUZZER = {
     'hoedur-dict': f'{HOEDUR_BIN}-dict-{HOEDUR_ARCH}',
     'hoedur-single-stream-dict': f'{HOEDUR_BIN}-single-stream-dict-{HOEDUR_ARCH}',
 }
+# interned keys (looked up for every campaign)
+FUZZER = {sys.intern(fuzzer): fuzzer_bin for (fuzzer, fuzzer_bin) in FUZZER.items()}
 MODES = ['plain', 'models', 'fuzzware']
 
-BUILD_MUTEX = threading.Lock()
+# corpus name suffix for (models, fuzzware)
+MODE_NAMES = {
+    (False, False): '-plain',
+    (True, False): '-models',
+    (False, True): '-fuzzware',
+    (True, True): '-models-fuzzware',
+}
+
+TARGET_BASE = f'{HOEDUR_TARGETS}/{HOEDUR_ARCH}'
 
 
 def init():
-    if not env('LD_LIBRARY_PATH'):
+    if not env_nonempty('LD_LIBRARY_PATH'):
         os.environ['LD_LIBRARY_PATH'] = CARGO_BIN
 
 
+@functools.lru_cache(maxsize=None)
 def cpu_cores(logical=True):
+    # import on first use (not needed by env helpers)
+    import psutil
     return psutil.cpu_count(logical=logical)
 
 
@@ -47,38 +97,216 @@ def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
-def build(binary, crate='hoedur-analyze', force_build=False):
-    global BUILD_MUTEX
-    BUILD_MUTEX.acquire()
+def tree_mtime(path):
+    # newest file below `path`
+    mtime = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                mtime = max(mtime, tree_mtime(entry.path))
+            else:
+                # don't follow symlinks: a dangling link is still a change
+                mtime = max(mtime, entry.stat(follow_symlinks=False).st_mtime)
 
-    # check if binary is available (e.g. in hoedur docker container)
-    if not force_build:
+    return mtime
+
+
+@functools.lru_cache(maxsize=None)
+def sources_mtime():
+    workspace = f'{SCRIPTS_DIR}/..'
+
+    # newest workspace source file: binaries depend on most workspace members
+    # (sources don't change during a run)
+    mtime = max(os.stat(f'{workspace}/Cargo.toml').st_mtime,
+                os.stat(f'{workspace}/Cargo.lock').st_mtime)
+    with os.scandir(workspace) as entries:
+        for entry in entries:
+            # workspace member (crate dir)
+            if entry.is_dir(follow_symlinks=False) and \
+                    os.path.isfile(f'{entry.path}/Cargo.toml'):
+                mtime = max(mtime, tree_mtime(entry.path))
+
+    return mtime
+
+
+def is_up_to_date(path, crate):
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return False
+
+    # no sources available to rebuild from (e.g. in hoedur docker container)
+    if file_type(f'{SCRIPTS_DIR}/../{crate}') != 'dir':
+        return True
+
+    try:
+        return mtime >= sources_mtime()
+    except FileNotFoundError:
+        # incomplete sources (e.g. missing src/), let cargo decide
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def binary_available(binary):
+    # optional: verify the binary can be executed
+    if BUILD_PROBE:
         try:
             subprocess.check_call([binary, '--help'],
                                   stdout=subprocess.DEVNULL)
+            return True
         except:
-            force_build = True
+            return False
 
-    # build binary
-    if force_build:
-        run([
-            'cargo', 'install', '--path', crate, '--bin', binary
-        ])
+    return shutil.which(binary) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def binary_supports(binary, flags):
+    # installed binary may predate command line flags required by a script
+    try:
+        usage = subprocess.run([binary, '--help'], stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
 
-    BUILD_MUTEX.release()
+    return all(flag.encode() in usage for flag in flags)
+
+
+def binary_usable(binary, flags):
+    # only run the binary when flags are required
+    return binary_available(binary) and (not flags or binary_supports(binary, flags))
+
+
+def build(binary, crate='hoedur-analyze', force_build=False, flags=()):
+    flags = tuple(flags)
+
+    # check if binary is available (e.g. in hoedur docker container)
+    if not force_build and binary_usable(binary, flags):
+        return False
+
+    # lock per binary, serializes builds of threads and concurrent script invocations
+    # (every open() has its own flock, so threads of one process exclude each other too)
+    os.makedirs(CARGO_BIN, exist_ok=True)
+    with open(f'{CARGO_BIN}/.{binary}.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        if not force_build:
+            # binary may have been built (by another script) while waiting for the lock
+            binary_available.cache_clear()
+            binary_supports.cache_clear()
+            force_build = not binary_usable(binary, flags)
+
+        # skip rebuild when installed binary is newer than all workspace sources
+        elif is_up_to_date(f'{CARGO_BIN}/{binary}', crate):
+            force_build = False
+
+        # build binary
+        if force_build:
+            # always ask cargo: it tracks all (workspace) dependencies,
+            # an up-to-date build is a cheap no-op
+            executable = cargo_build(binary, crate)
+            install_binary(executable, binary)
+
+            binary_available.cache_clear()
+            binary_supports.cache_clear()
 
     return force_build
 
 
+def cargo_build(binary, crate):
+    # release build, executable path is taken from the JSON artifact messages
+    cmd = [
+        'cargo', 'build', '--release',
+        '--manifest-path', f'{SCRIPTS_DIR}/../{crate}/Cargo.toml',
+        '--bin', binary,
+        '--message-format=json-render-diagnostics'
+    ]
+    eprint(f'running {cmd} ...')
+
+    executable = None
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as p:
+        for line in p.stdout:
+            msg = json_loads(line)
+            if msg.get('reason') == 'compiler-artifact' and \
+                    msg['target']['name'] == binary and msg.get('executable'):
+                executable = msg['executable']
+
+    if p.returncode != 0:
+        raise subprocess.CalledProcessError(p.returncode, cmd)
+    elif executable is None:
+        raise FileNotFoundError(f'cargo did not report an executable for {binary}')
+
+    return executable
+
+
+def install_binary(executable, binary):
+    # copy next to the destination, then atomically replace it
+    # (running processes keep the old binary)
+    dst = f'{CARGO_BIN}/{binary}'
+    tmp = f'{dst}.{os.getpid()}.tmp'
+    shutil.copy2(executable, tmp)
+    os.replace(tmp, dst)
+
+
 def binary(cmd):
     return [cmd]
 
 
-def run(cmd, log=None, logfile=None, timeout=None, **kwargs):
-    eprint(
-        f'running {cmd}, log = {log}, logfile = {logfile}, timeout = {timeout} ...')
+def json_load(path):
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
 
-    # log / logfile
+    with open(path) as f:
+        return json.load(f)
+
+
+def json_loads(data):
+    if orjson:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def json_dump(obj, path, sort_keys=False):
+    if orjson:
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, sort_keys=sort_keys)
+
+
+def collect_reports(corpus, targets, suffix='.report.bin.zst'):
+    # report files per target (dict target -> [file name]), corpus dir is scanned once
+    try:
+        names = sorted(entry.name for entry in os.scandir(corpus)
+                       if entry.name.endswith(suffix))
+    except FileNotFoundError:
+        names = []
+
+    reports = {}
+    for target in targets:
+        prefix = 'TARGET-{}-'.format(target.replace('/', '-'))
+
+        # sorted names: all matches are consecutive
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+
+        reports[target] = names[start:end]
+
+    return reports
+
+
+def open_log(log, logfile):
+    # (stdout, stderr, log_fd) for log / logfile, caller closes log_fd after spawn
+    log_fd = None
     if log == False:
         stdout = subprocess.DEVNULL
         stderr = subprocess.DEVNULL
@@ -86,50 +314,184 @@ def run(cmd, log=None, logfile=None, timeout=None, **kwargs):
         if logfile is not None:
             log = logfile
 
-        stdout = open(log, 'wb')
-        stderr = subprocess.STDOUT
+        # the child writes straight into the log file (no pipe / copy in
+        # python), so log writes never pass through this process
+        log_fd = os.open(log, os.O_WRONLY | os.O_CREAT |
+                         os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        # same fd for both: no extra dup2 of stdout in the child
+        stdout = log_fd
+        stderr = log_fd
     else:
         stdout = None
         stderr = None
 
-    # exec
-    p = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, **kwargs)
+    return (stdout, stderr, log_fd)
 
-    # terminate after timeout
+
+def kill_group(p, sig):
+    # signal the whole process group (incl. grandchildren)
     try:
-        return p.wait(timeout)
-    except subprocess.TimeoutExpired:
-        p.terminate()
+        os.killpg(p.pid, sig)
+    except ProcessLookupError:
+        pass
+
 
-    # try second terminate after graceperiod
+async def run_async(cmd, log=None, logfile=None, timeout=None, grace_seconds=60, **kwargs):
+    eprint(
+        f'running {cmd}, log = {log}, logfile = {logfile}, timeout = {timeout} ...')
+
+    # no preexec_fn: keep the fast (vfork / posix_spawn) exec path
+    assert 'preexec_fn' not in kwargs
+
+    # log / logfile
+    (stdout, stderr, log_fd) = open_log(log, logfile)
+
+    # exec (in own session / process group)
     try:
-        return p.wait(timeout=10 * 60)
-    except subprocess.TimeoutExpired:
-        p.terminate()
+        p = await asyncio.create_subprocess_exec(*cmd, stdout=stdout, stderr=stderr,
+                                                 close_fds=True, start_new_session=True, **kwargs)
+    finally:
+        # child has its own copy of the log fd
+        if log_fd is not None:
+            os.close(log_fd)
+
+    # terminate process group after timeout
+    try:
+        return await asyncio.wait_for(p.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    except asyncio.CancelledError:
+        # interrupted (e.g. Ctrl-C), which does not reach the new session:
+        # stop child before propagating
+        await stop_group(p, cmd, grace_seconds)
+        raise
+
+    if not await stop_group(p, cmd, grace_seconds):
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    return p.returncode
+
+
+async def stop_group(p, cmd, grace_seconds):
+    # SIGTERM (clean exit, finalizes corpus archive), SIGTERM (stop QEMU), SIGKILL
+    # cancellation skips to the next stage, returns False if SIGKILL was needed
+    cancelled = False
+    stopped = False
+    for (sig, grace) in ((signal.SIGTERM, grace_seconds), (signal.SIGTERM, grace_seconds), (signal.SIGKILL, None)):
+        kill_group(p, sig)
+        if sig == signal.SIGKILL:
+            eprint('ERROR: process', cmd[0], 'did not terminate')
+
+        try:
+            await asyncio.wait_for(p.wait(), grace)
+            stopped = sig != signal.SIGKILL
+            break
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            cancelled = True
+
+    if cancelled:
+        raise asyncio.CancelledError()
+
+    return stopped
+
+
+def run(cmd, log=None, logfile=None, timeout=None, grace_seconds=60, **kwargs):
+    return asyncio.run(run_async(cmd, log, logfile, timeout, grace_seconds, **kwargs))
+
+
+def run_parallel(jobs, cores):
+    # run (cmd, kwargs, done) jobs, at most `cores` at a time, done(returncode) is called on exit
+    # kwargs go to Popen, except stdout_file (path for stdout)
+    if cores <= 0:
+        raise ValueError(f'invalid number of cores: {cores}')
+
+    # pid -> (p, done, pidfd)
+    running = {}
+    poller = select.poll()
+
+    def reap():
+        # wait for our children only: other children of this process (asyncio
+        # watchers, Popen objects of other threads) keep their exit status
+        if all(pidfd is not None for (_, _, pidfd) in running.values()):
+            poller.poll()
+        else:
+            # no pidfd support: recheck periodically
+            poller.poll(100)
+
+        for (pid, (p, done, pidfd)) in list(running.items()):
+            if p.poll() is None:
+                continue
+
+            del running[pid]
+            if pidfd is not None:
+                poller.unregister(pidfd)
+                os.close(pidfd)
+
+            if done:
+                done(p.returncode)
 
-    # kill after another graceperiod
     try:
-        return p.wait(timeout=10 * 60)
-    except subprocess.TimeoutExpired as e:
-        p.kill()
-        eprint('ERROR: process', cmd[0], 'did not terminate')
-        raise e
+        for (cmd, kwargs, done) in jobs:
+            while len(running) >= cores:
+                reap()
+
+            # no preexec_fn: keep the fast (vfork / posix_spawn) exec path
+            assert 'preexec_fn' not in kwargs
+
+            # optional: stdout to file, the child has its own copy of the fd
+            kwargs = dict(kwargs)
+            stdout_file = kwargs.pop('stdout_file', None)
+            if stdout_file is not None:
+                kwargs['stdout'] = os.open(stdout_file, os.O_WRONLY | os.O_CREAT |
+                                           os.O_TRUNC | os.O_CLOEXEC, 0o644)
+
+            eprint(f'running {cmd} ...')
+            try:
+                p = subprocess.Popen(cmd, close_fds=True, **kwargs)
+            finally:
+                if stdout_file is not None:
+                    os.close(kwargs['stdout'])
+
+            # pidfd becomes readable once the process exited
+            try:
+                pidfd = os.pidfd_open(p.pid)
+                poller.register(pidfd, select.POLLIN)
+            except (AttributeError, OSError):
+                pidfd = None
+
+            running[p.pid] = (p, done, pidfd)
+
+        while len(running) > 0:
+            reap()
+    except BaseException:
+        for (p, _, _) in running.values():
+            p.terminate()
+        for (p, _, _) in running.values():
+            p.wait()
+        raise
+    finally:
+        for (_, _, pidfd) in running.values():
+            if pidfd is not None:
+                os.close(pidfd)
+
+
+DURATION_RE = re.compile(r'\A(\d+)([smhd])\Z')
+DURATION_UNITS = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 60 * 60 * 24,
+}
 
 
 def parse_duration(value):
-    if 's' in value:
-        value = int(value.rstrip('s'))
-    elif 'm' in value:
-        value = int(value.rstrip('m')) * 60
-    elif 'h' in value:
-        value = int(value.rstrip('h')) * 60 * 60
-    elif 'd' in value:
-        value = int(value.rstrip('d')) * 60 * 60 * 24
-    else:
-        eprint('ERROR: unknown duration format')
-        assert False
+    match = DURATION_RE.match(value)
+    if match is None:
+        raise ValueError(f'unknown duration format: {value!r}')
 
-    return value
+    return int(match.group(1)) * DURATION_UNITS[match.group(2)]
 
 
 class CorpusExistsException(Exception):
@@ -140,21 +502,44 @@ class CorpusExistsException(Exception):
         return f'ERROR: corpus already exists: {self.path}'
 
 
-def init_hoedur(corpus_base, target, fuzzer, models, fuzzware, duration, run_id, overwrite):
-    init()
+def file_type(path):
+    # 'dir', 'file' or None (single stat)
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        # like os.path.isdir / isfile (e.g. not a dir, permission denied)
+        return None
+
+    if stat.S_ISDIR(mode):
+        return 'dir'
+    elif stat.S_ISREG(mode):
+        return 'file'
+    else:
+        return None
+
+
+def mkdirs(path):
+    # fast path: most dirs already exist after the first run
+    try:
+        os.makedirs(path)
+    except FileExistsError:
+        # path may also be an existing file
+        if file_type(path) != 'dir':
+            raise
 
-    modes = ''
-    if models:
-        modes += '-models'
-    if fuzzware:
-        modes += '-fuzzware'
-    if modes == '':
-        modes += '-plain'
 
+def model_share_dir(corpus_base, target):
+    return '{}/model-share-{}'.format(corpus_base, target.replace('/', '-'))
+
+
+def init_hoedur(corpus_base, target, fuzzer, models, fuzzware, duration, run_id, overwrite, mkdir=True):
+    init()
+
+    modes = MODE_NAMES[(bool(models), bool(fuzzware))]
     target_name = target.replace('/', '-')
 
     name = f'TARGET-{target_name}-FUZZER-{fuzzer}-RUN-{run_id:02d}-DURATION-{duration}-MODE{modes}'
-    target_dir = '{}/{}/{}'.format(HOEDUR_TARGETS, HOEDUR_ARCH, target)
+    target_dir = f'{TARGET_BASE}/{target}'
     corpus = corpus_base + '/' + name
     corpus_tar = f'{corpus}.corpus.tar.zst'
 
@@ -162,18 +547,21 @@ def init_hoedur(corpus_base, target, fuzzer, models, fuzzware, duration, run_id,
     eprint('corpus =', corpus)
     eprint('target_dir =', target_dir)
 
-    os.makedirs(corpus_base, exist_ok=True)
+    if mkdir:
+        mkdirs(corpus_base)
 
-    if os.path.isdir(corpus) and not overwrite:
-        raise CorpusExistsException(corpus)
-    elif os.path.isfile(corpus_tar) and not overwrite:
-        raise CorpusExistsException(corpus_tar)
+    if not overwrite:
+        if file_type(corpus) == 'dir':
+            raise CorpusExistsException(corpus)
+        elif file_type(corpus_tar) == 'file':
+            raise CorpusExistsException(corpus_tar)
 
     # make sure hoedur is built
-    build_hoedur(fuzzer)
+    fuzzer_bin = FUZZER[fuzzer]
+    build_hoedur(fuzzer_bin)
 
     hoedur = [
-        FUZZER[fuzzer],
+        fuzzer_bin,
         '--name', name,
         '--config', f'{target_dir}/{CONFIG_FILE}'
     ]
@@ -183,8 +571,9 @@ def init_hoedur(corpus_base, target, fuzzer, models, fuzzware, duration, run_id,
 
     if fuzzware:
         # create model share folder
-        model_share = f'{corpus_base}/model-share-{target_name}'
-        os.makedirs(model_share, exist_ok=True)
+        model_share = model_share_dir(corpus_base, target)
+        if mkdir:
+            mkdirs(model_share)
 
         # enable fuzzware modeling
         hoedur += ['--fuzzware', '--model-share', model_share]
@@ -192,20 +581,87 @@ def init_hoedur(corpus_base, target, fuzzer, models, fuzzware, duration, run_id,
     return corpus, hoedur
 
 
+def init_hoedur_batch(configs):
+    # init_hoedur per argument tuple, creating each dir only once
+    # returns ([(config, corpus, hoedur)], [(config, CorpusExistsException)])
+    for corpus_base in sorted({config[0] for config in configs}):
+        mkdirs(corpus_base)
+
+    runs = []
+    errors = []
+    model_shares = set()
+    for config in configs:
+        try:
+            (corpus, hoedur) = init_hoedur(*config, mkdir=False)
+        except CorpusExistsException as e:
+            errors.append((config, e))
+            continue
+
+        # create model share folder (only for runs that go ahead)
+        (corpus_base, target, _, _, fuzzware, _, _, _) = config
+        if fuzzware:
+            model_share = model_share_dir(corpus_base, target)
+            if model_share not in model_shares:
+                mkdirs(model_share)
+                model_shares.add(model_share)
+
+        runs.append((config, corpus, hoedur))
+
+    return (runs, errors)
+
+
 def init_hoedur_import_config(fuzzer, archive):
     init()
-    build_hoedur(fuzzer)
+    fuzzer_bin = FUZZER[fuzzer]
+    build_hoedur(fuzzer_bin)
     basename = os.path.basename(archive).replace('.corpus.tar.zst', '')
-    return [FUZZER[fuzzer], '--name', basename, '--import-config', archive]
+    return [fuzzer_bin, '--name', basename, '--import-config', archive]
+
+
+def is_copy_of(src, dst):
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+
+    # same file (e.g. symlinked dir) or unchanged copy
+    return os.path.samestat(src_stat, dst_stat) or \
+        (src_stat.st_size == dst_stat.st_size and src_stat.st_mtime <= dst_stat.st_mtime)
+
+
+def copy_file(src, dst):
+    if not hasattr(os, 'sendfile') or not hasattr(os, 'posix_fadvise'):
+        shutil.copyfile(src, dst)
+        return
+
+    # copy in kernel (zero-copy), one-shot read: drop source from page cache
+    src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT |
+                         os.O_TRUNC | os.O_CLOEXEC, 0o666)
+        try:
+            while os.sendfile(dst_fd, src_fd, None, 1 << 30) > 0:
+                pass
+        finally:
+            os.close(dst_fd)
 
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(src_fd)
 
-def build_hoedur(fuzzer):
-    binary = FUZZER[fuzzer]
 
+@functools.lru_cache(maxsize=None)
+def build_hoedur(binary):
     # build binary
-    if build(binary, 'hoedur'):
-        # copy library
-        shutil.copyfile(
-            f'{SCRIPTS_DIR}/../target/release/libqemu-system-arm.release.so',
-            f'{CARGO_BIN}/libqemu-system-arm.release.so'
-        )
+    built = build(binary, 'hoedur')
+    if built:
+        # copy library (unless unchanged)
+        src = f'{SCRIPTS_DIR}/../target/release/libqemu-system-arm.release.so'
+        dst = f'{CARGO_BIN}/libqemu-system-arm.release.so'
+        if not is_copy_of(src, dst):
+            copy_file(src, dst)
+
+    return built